@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import typing
+from operator import attrgetter
 from typing import Optional, Tuple, Union, cast
 
 from flytekit.core.context_manager import ExecutionState, FlyteContextManager
@@ -103,7 +104,7 @@ class ConditionalSection:
             n = Node(
                 id=f"{ctx.compilation_state.prefix}n{len(ctx.compilation_state.nodes)}",  # type: ignore
                 metadata=_core_wf.NodeMetadata(self._name, timeout=datetime.timedelta(), retries=RetryStrategy(0)),
-                bindings=sorted(bindings, key=lambda b: b.var),
+                bindings=sorted(bindings, key=attrgetter("var")),
                 upstream_nodes=list(upstream_nodes),  # type: ignore
                 flyte_entity=node,
             )
@@ -50,11 +50,12 @@ class Interface(object):
                     self._inputs[k] = v
                 else:
                     self._inputs[k] = (v, None)
+        self._default_inputs_as_kwargs = {k: v[1] for k, v in self._inputs.items() if v[1] is not None}
         self._outputs = outputs if outputs else {}
         self._output_tuple_name = output_tuple_name
 
         if outputs:
-            variables = [k for k in outputs.keys()]
+            variables = list(outputs)
 
             # TODO: This class is a duplicate of the one in create_task_outputs. Over time, we should move to this one.
             class Output(collections.namedtuple(output_tuple_name or "DefaultNamedTupleOutput", variables)):
@@ -99,15 +100,12 @@ class Interface(object):
 
     @property
     def inputs(self) -> typing.Dict[str, Type]:
-        r = {}
-        for k, v in self._inputs.items():
-            r[k] = v[0]
-        return r
+        return {k: v[0] for k, v in self._inputs.items()}
 
     @property
     def output_names(self) -> Optional[List[str]]:
         if self.outputs:
-            return [k for k in self.outputs.keys()]
+            return list(self.outputs)
         return None
 
     @property
@@ -116,7 +114,7 @@ class Interface(object):
 
     @property
     def default_inputs_as_kwargs(self) -> Dict[str, Any]:
-        return {k: v[1] for k, v in self._inputs.items() if v[1] is not None}
+        return dict(self._default_inputs_as_kwargs)
 
     @property
     def outputs(self) -> typing.Dict[str, type]:
@@ -531,7 +531,7 @@ def create_task_output(
 
     # These should be OrderedDicts so it should be safe to iterate over the keys.
     if entity_interface:
-        variables = [k for k in entity_interface.outputs.keys()]
+        variables = list(entity_interface.outputs)
 
     named_tuple_name = "DefaultNamedTupleOutput"
     if entity_interface and entity_interface.output_tuple_name:
@@ -857,7 +857,8 @@ def create_and_link_node_from_remote(
         # TODO: Better naming, probably a derivative of the function name.
         id=f"{ctx.compilation_state.prefix}n{len(ctx.compilation_state.nodes)}",
         metadata=entity.construct_node_metadata(),
-        bindings=sorted(bindings, key=lambda b: b.var),
+        # Bindings were created while iterating over the sorted input names, so they are already ordered by var.
+        bindings=bindings,
         upstream_nodes=upstream_nodes,
         flyte_entity=entity,
     )
@@ -951,7 +952,8 @@ def create_and_link_node(
         # TODO: Better naming, probably a derivative of the function name.
         id=f"{ctx.compilation_state.prefix}n{len(ctx.compilation_state.nodes)}",
         metadata=entity.construct_node_metadata(),
-        bindings=sorted(bindings, key=lambda b: b.var),
+        # Bindings were created while iterating over the sorted input names, so they are already ordered by var.
+        bindings=bindings,
         upstream_nodes=upstream_nodes,
         flyte_entity=entity,
     )
@@ -77,20 +77,15 @@ class TrackedInstance(metaclass=InstanceTrackingMeta):
 
         logger.debug(f"Looking for LHS for {self} from {self._instantiated_in}")
         m = _importlib.import_module(self._instantiated_in)
-        for k in dir(m):
-            try:
-                if getattr(m, k) is self:
-                    logger.debug(f"Found LHS for {self}, {k}")
-                    self._lhs = k
-                    return k
-            except ValueError as err:
-                # Empty pandas dataframes behave weirdly here such that calling `m.df` raises:
-                # ValueError: The truth value of a {type(self).__name__} is ambiguous. Use a.empty, a.bool(), a.item(),
-                #   a.any() or a.all()
-                # Since dataframes aren't registrable entities to begin with we swallow any errors they raise and
-                # continue looping through m.
-                logger.warning("Caught ValueError {} while attempting to auto-assign name".format(err))
-                pass
+        # Read the module's namespace directly rather than going through dir() and getattr() for every name. Values
+        # are only compared by identity, so arbitrary module attributes (e.g. pandas dataframes, which raise on
+        # truthiness checks) are never evaluated. Iterate in sorted order to match what dir() would have returned.
+        module_vars = vars(m)
+        for k in sorted(module_vars):
+            if module_vars[k] is self:
+                logger.debug(f"Found LHS for {self}, {k}")
+                self._lhs = k
+                return k
 
         logger.error(f"Could not find LHS for {self} in {self._instantiated_in}")
         raise _system_exceptions.FlyteSystemException(f"Error looking for LHS in {self._instantiated_in}")
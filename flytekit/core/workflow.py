@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from functools import update_wrapper
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 from flytekit.core import constants as _common_constants
 from flytekit.core.base_task import PythonTask
@@ -161,6 +162,52 @@ def get_promise_map(
     return entity_kwargs
 
 
+def _remaining_after_topological_sort(edges: List[List[int]]) -> Set[int]:
+    """
+    Runs Kahn's algorithm over a graph given as adjacency lists and returns the indices of the nodes it couldn't
+    order, i.e. the nodes in a cycle along with everything reachable from one.
+    """
+    in_degree = [0] * len(edges)
+    for targets in edges:
+        for t in targets:
+            in_degree[t] += 1
+
+    ready = deque(i for i, d in enumerate(in_degree) if d == 0)
+    while ready:
+        i = ready.popleft()
+        for t in edges[i]:
+            in_degree[t] -= 1
+            if in_degree[t] == 0:
+                ready.append(t)
+    return {i for i, d in enumerate(in_degree) if d > 0}
+
+
+def _check_for_cycles(workflow_name: str, nodes: List[Node]):
+    """
+    Nodes wired together through data dependencies can't form a cycle, but explicit ordering with
+    ``runs_before``/``>>`` can, and such a workflow would otherwise only fail much later when the serializer recurses
+    through upstream nodes forever.
+    """
+    index = {n: i for i, n in enumerate(nodes)}
+    downstream: List[List[int]] = [[] for _ in nodes]
+    upstream: List[List[int]] = [[] for _ in nodes]
+    for i, n in enumerate(nodes):
+        for upstream_node in n.upstream_nodes:
+            j = index.get(upstream_node)
+            # Upstream nodes outside this list (e.g. the global input node) can't be part of a cycle here.
+            if j is not None:
+                downstream[j].append(i)
+                upstream[i].append(j)
+
+    remaining = _remaining_after_topological_sort(downstream)
+    if remaining:
+        # The forward pass also leaves behind everything downstream of a cycle, and sorting the reversed graph leaves
+        # everything upstream of one, so only the nodes left over by both are reported.
+        remaining &= _remaining_after_topological_sort(upstream)
+        cyclic_nodes = [nodes[i].id for i in sorted(remaining)]
+        raise FlyteValidationException(f"Workflow {workflow_name} contains a cycle between nodes {cyclic_nodes}")
+
+
 class WorkflowBase(object):
     def __init__(
         self,
@@ -232,9 +279,12 @@ class WorkflowBase(object):
         """
         Workflow needs to fill in default arguments before invoking the call handler.
         """
-        # Get default arguments and override with kwargs passed in
-        input_kwargs = self.python_interface.default_inputs_as_kwargs
-        input_kwargs.update(kwargs)
+        # Get default arguments and override with kwargs passed in. This reads the interface's own copy of the defaults
+        # rather than the public property (which hands out a fresh dict), so it must never be modified here: it's only
+        # merged into a new dict when there is something to override, and unpacking it below copies it either way.
+        input_kwargs = self._python_interface._default_inputs_as_kwargs
+        if kwargs:
+            input_kwargs = {**input_kwargs, **kwargs}
         return flyte_entity_call_handler(self, *args, **input_kwargs)
 
     def execute(self, **kwargs):
@@ -243,10 +293,12 @@ class WorkflowBase(object):
     def local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
         # This is done to support the invariant that Workflow local executions always work with Promise objects
         # holding Flyte literal values. Even in a wf, a user can call a sub-workflow with a Python native value.
+        python_inputs = self.python_interface.inputs
+        flyte_inputs = self.interface.inputs
         for k, v in kwargs.items():
             if not isinstance(v, Promise):
-                t = self.python_interface.inputs[k]
-                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, t, self.interface.inputs[k].type))
+                t = python_inputs[k]
+                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, t, flyte_inputs[k].type))
 
         # The output of this will always be a combination of Python native values and Promises containing Flyte
         # Literals.
@@ -466,27 +518,18 @@ class ImperativeWorkflow(WorkflowBase):
         with FlyteContextManager.with_context(ctx.with_compilation_state(self.compilation_state)) as ctx:
             n = create_node(entity=entity, **kwargs)
 
-            def get_input_values(input_value):
-                if isinstance(input_value, list):
-                    input_promises = []
-                    for x in input_value:
-                        input_promises.extend(get_input_values(x))
-                    return input_promises
-                if isinstance(input_value, dict):
-                    input_promises = []
-                    for _, v in input_value.items():
-                        input_promises.extend(get_input_values(v))
-                    return input_promises
-                else:
-                    return [input_value]
-
-            # Every time an entity is added, mark it as used. The above function though will gather all the input
-            # values but we're only interested in the ones that are Promises so let's filter for those.
+            # Every time an entity is added, mark its inputs as used. Walk the (possibly nested) lists and dicts of
+            # input values breadth-first. Only containers are queued; of the leaves, only Promises are of interest.
             # There's probably a way to clean this up, maybe key off of the name instead of value?
-            all_input_values = get_input_values(kwargs)
-            for input_value in filter(lambda x: isinstance(x, Promise), all_input_values):
-                if input_value in self._unbound_inputs:
-                    self._unbound_inputs.remove(input_value)
+            to_visit = deque([kwargs.values()])
+            while to_visit:
+                for input_value in to_visit.popleft():
+                    if isinstance(input_value, list):
+                        to_visit.append(input_value)
+                    elif isinstance(input_value, dict):
+                        to_visit.append(input_value.values())
+                    elif isinstance(input_value, Promise) and input_value in self._unbound_inputs:
+                        self._unbound_inputs.remove(input_value)
             return n
 
     def add_workflow_input(self, input_name: str, python_type: Type) -> Interface:
@@ -609,10 +652,11 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
             ctx.with_compilation_state(CompilationState(prefix=prefix, task_resolver=self))
         ) as comp_ctx:
             # Construct the default input promise bindings, but then override with the provided inputs, if any
-            input_kwargs = construct_input_promises([k for k in self.interface.inputs.keys()])
+            input_kwargs = construct_input_promises(list(self.interface.inputs))
             input_kwargs.update(kwargs)
             workflow_outputs = exception_scopes.user_entry_point(self._workflow_function)(**input_kwargs)
             all_nodes.extend(comp_ctx.compilation_state.nodes)
+            _check_for_cycles(self.name, all_nodes)
 
             # This little loop was added as part of the task resolver change. The task resolver interface itself is
             # more or less stateless (the future-proofing get_all_tasks function notwithstanding). However the
@@ -33,6 +33,14 @@ class Identifier(_common_models.FlyteIdlEntity):
         """
         return self._resource_type
 
+    def __hash__(self):
+        # Identifiers are used as dictionary keys all over the place (tasks, sub-workflows and launch plans when
+        # promoting a compiled closure for instance), so hash the fields rather than serializing to protobuf each
+        # time. Unset fields are normalized to their protobuf defaults to stay consistent with __eq__.
+        return hash(
+            (self._resource_type or 0, self._project or "", self._domain or "", self._name or "", self._version or "")
+        )
+
     def resource_type_name(self) -> str:
         return _identifier_pb2.ResourceType.Name(self.resource_type)
 
@@ -43,8 +43,8 @@ class FlyteTaskNode(_workflow_model.TaskNode):
         """
         from flytekit.remote.task import FlyteTask
 
-        if base_model.reference_id in tasks:
-            task = tasks[base_model.reference_id]
+        task = tasks.get(base_model.reference_id)
+        if task is not None:
             remote_logger.debug(f"Found existing task template for {task.id}, will not retrieve from Admin")
             flyte_task = FlyteTask.promote_from_model(task)
             return cls(flyte_task)
@@ -114,10 +114,11 @@ class FlyteWorkflowNode(_workflow_model.WorkflowNode):
             )
         elif base_model.sub_workflow_ref is not None:
             # the workflow templates for sub-workflows should have been included in the original response
-            if base_model.reference in sub_workflows:
+            sub_workflow = sub_workflows.get(base_model.reference)
+            if sub_workflow is not None:
                 return cls(
                     flyte_workflow=_workflow.FlyteWorkflow.promote_from_model(
-                        sub_workflows[base_model.reference],
+                        sub_workflow,
                         sub_workflows=sub_workflows,
                         node_launch_plans=node_launch_plans,
                         tasks=tasks,
@@ -154,7 +154,7 @@ class FlyteNode(_hash_mixin.HashOnReferenceMixin, _workflow_model.Node):
 
     @property
     def upstream_node_ids(self) -> List[str]:
-        return list(sorted(n.id for n in self.upstream_nodes))
+        return sorted(n.id for n in self.upstream_nodes)
 
     @property
     def outputs(self) -> Dict[str, NodeOutput]:
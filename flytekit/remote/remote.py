@@ -370,9 +370,12 @@ class FlyteRemote(object):
         settings: typing.Optional[SerializationSettings],
         version: str,
         options: typing.Optional[Options] = None,
+        create_default_launchplan: bool = True,
     ) -> Identifier:
         """
         This method serializes and register the given Flyte entity
+        :param create_default_launchplan: Whether to create the default launch plan of the given entity, if it is a
+          workflow. Default launch plans of its sub-workflows are always created.
         :return: Identifier of the registered entity
         """
         m = OrderedDict()
@@ -390,6 +393,7 @@ class FlyteRemote(object):
         )
         _ = get_serializable(m, settings=serialization_settings, entity=entity, options=options)
 
+        root_entity = entity
         ident = None
         for entity, cp_entity in m.items():
             if isinstance(entity, RemoteEntity):
@@ -423,21 +427,29 @@ class FlyteRemote(object):
                     self.client.create_task(task_identifer=ident, task_spec=cp_entity)
                 elif isinstance(cp_entity, admin_workflow_models.WorkflowSpec):
                     ident = self._resolve_identifier(ResourceType.WORKFLOW, entity.name, version, settings)
+                    # Check for the workflow first, so that specs that are already registered aren't shipped to Admin
+                    # only to be rejected.
                     try:
-                        self.client.create_workflow(workflow_identifier=ident, workflow_spec=cp_entity)
-                    except FlyteEntityAlreadyExistsException:
+                        self.client.get_workflow(ident)
                         remote_logger.info(f"{entity.name} already exists")
+                    except FlyteEntityNotExistException:
+                        try:
+                            self.client.create_workflow(workflow_identifier=ident, workflow_spec=cp_entity)
+                        except FlyteEntityAlreadyExistsException:
+                            remote_logger.info(f"{entity.name} already exists")
                     # Let us also create a default launch-plan, ideally the default launchplan should be added
                     # to the orderedDict, but we do not.
-                    default_lp = LaunchPlan.get_default_launch_plan(self.context, entity)
-                    lp_entity = get_serializable_launch_plan(
-                        OrderedDict(),
-                        settings or serialization_settings,
-                        default_lp,
-                        recurse_downstream=False,
-                        options=options,
-                    )
-                    self.client.create_launch_plan(lp_entity.id, lp_entity.spec)
+                    if create_default_launchplan or entity is not root_entity:
+                        default_lp = LaunchPlan.get_default_launch_plan(self.context, entity)
+                        lp_entity = get_serializable_launch_plan(
+                            OrderedDict(),
+                            settings or serialization_settings,
+                            default_lp,
+                            recurse_downstream=False,
+                            options=options,
+                        )
+                        self.client.create_launch_plan(lp_entity.id, lp_entity.spec)
+                        remote_logger.debug(f"Created default launch plan for workflow {entity.name}")
                 elif isinstance(cp_entity, launch_plan_models.LaunchPlan):
                     ident = self._resolve_identifier(ResourceType.LAUNCH_PLAN, entity.name, version, settings)
                     self.client.create_launch_plan(launch_plan_identifer=ident, launch_plan_spec=cp_entity.spec)
@@ -496,14 +508,9 @@ class FlyteRemote(object):
             b.domain = ident.domain
             b.version = ident.version
             serialization_settings = b.build()
-        ident = self._serialize_and_register(entity, serialization_settings, version, options)
-        if default_launch_plan:
-            default_lp = LaunchPlan.get_default_launch_plan(self.context, entity)
-            self.register_launch_plan(
-                default_lp, version=ident.version, project=ident.project, domain=ident.domain, options=options
-            )
-            remote_logger.debug("Created default launch plan for Workflow")
-
+        # The default launch plan is serialized and created alongside the workflow, rather than being registered (and
+        # fetched back) a second time through register_launch_plan.
+        ident = self._serialize_and_register(entity, serialization_settings, version, options, default_launch_plan)
         fwf = self.fetch_workflow(ident.project, ident.domain, ident.name, ident.version)
         fwf._python_interface = entity.python_interface
         return fwf
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Dict, List, Optional
 
 from flytekit.core import constants as _constants
@@ -14,6 +15,21 @@ from flytekit.remote import interface as _interfaces
 from flytekit.remote import nodes as _nodes
 from flytekit.remote.remote_callable import RemoteEntity
 
+_SYSTEM_NODE_IDS = frozenset((_constants.START_NODE_ID, _constants.END_NODE_ID))
+
+
+def _validate_upstream_nodes(nodes: List[_nodes.FlyteNode]):
+    """
+    Makes sure every upstream edge points at a node that has an id, walking all the edges in a single pass.
+    """
+    upstream_nodes = chain.from_iterable(n.upstream_nodes for n in nodes)
+    if any(upstream.id is None for upstream in upstream_nodes):
+        raise _user_exceptions.FlyteAssertion(
+            "Some nodes contained in the workflow were not found in the workflow description.  Please "
+            "ensure all nodes are either assigned to attributes within the class or an element in a "
+            "list, dict, or tuple which is stored as an attribute in the class."
+        )
+
 
 class FlyteWorkflow(_hash_mixin.HashOnReferenceMixin, RemoteEntity, _workflow_models.WorkflowTemplate):
     """A class encapsulating a remote Flyte workflow."""
@@ -32,14 +48,7 @@ class FlyteWorkflow(_hash_mixin.HashOnReferenceMixin, RemoteEntity, _workflow_mo
         compiled_closure: Optional[compiler_models.CompiledWorkflowClosure] = None,
     ):
         # TODO: Remove check
-        for node in nodes:
-            for upstream in node.upstream_nodes:
-                if upstream.id is None:
-                    raise _user_exceptions.FlyteAssertion(
-                        "Some nodes contained in the workflow were not found in the workflow description.  Please "
-                        "ensure all nodes are either assigned to attributes within the class or an element in a "
-                        "list, dict, or tuple which is stored as an attribute in the class."
-                    )
+        _validate_upstream_nodes(nodes)
         super(FlyteWorkflow, self).__init__(
             id=id,
             metadata=metadata,
@@ -80,7 +89,7 @@ class FlyteWorkflow(_hash_mixin.HashOnReferenceMixin, RemoteEntity, _workflow_mo
 
     @classmethod
     def get_non_system_nodes(cls, nodes: List[_workflow_models.Node]) -> List[_workflow_models.Node]:
-        return [n for n in nodes if n.id not in {_constants.START_NODE_ID, _constants.END_NODE_ID}]
+        return [n for n in nodes if n.id not in _SYSTEM_NODE_IDS]
 
     @classmethod
     def promote_from_model(
@@ -98,12 +107,9 @@ class FlyteWorkflow(_hash_mixin.HashOnReferenceMixin, RemoteEntity, _workflow_mo
             for node in base_model_non_system_nodes
         }
 
-        # Set upstream nodes for each node
+        # Set upstream nodes for each node, now that every node has been promoted.
         for n in base_model_non_system_nodes:
-            current = node_map[n.id]
-            for upstream_id in n.upstream_node_ids:
-                upstream_node = node_map[upstream_id]
-                current._upstream.append(upstream_node)
+            node_map[n.id]._upstream.extend([node_map[upstream_id] for upstream_id in n.upstream_node_ids])
 
         # No inputs/outputs specified, see the constructor for more information on the overrides.
         wf = cls(
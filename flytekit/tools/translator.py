@@ -16,6 +16,7 @@ from flytekit.core.reference_entity import ReferenceEntity, ReferenceSpec, Refer
 from flytekit.core.task import ReferenceTask
 from flytekit.core.utils import _dnsify
 from flytekit.core.workflow import ReferenceWorkflow, WorkflowBase
+from flytekit.exceptions.user import FlyteValidationException
 from flytekit.models import common as _common_models
 from flytekit.models import common as common_models
 from flytekit.models import interface as interface_models
@@ -229,7 +230,24 @@ def get_serializable_workflow(
         if n.id != _common_constants.GLOBAL_INPUT_NODE_ID
     ]
 
-    sub_wfs = []
+    # Sub-workflows are keyed by identifier so that a workflow reachable through several nodes (or through several
+    # levels of nesting) is only carried once. Children have already flattened their own sub-workflows into their
+    # spec, so there's no need to walk further down than one level here.
+    sub_wfs: Dict[_identifier_model.Identifier, workflow_model.WorkflowTemplate] = {}
+
+    def add_sub_wfs(templates: typing.Iterable[workflow_model.WorkflowTemplate]):
+        for t in templates:
+            existing = sub_wfs.get(t.id)
+            if existing is None:
+                sub_wfs[t.id] = t
+            # Templates reached through the entity mapping are the same object every time, so only fall back to
+            # comparing content when they aren't.
+            elif existing is not t and existing != t:
+                raise FlyteValidationException(
+                    f"Workflow {entity.name} contains different sub-workflows with the same id "
+                    f"{t.id.project}:{t.id.domain}:{t.id.name}:{t.id.version}"
+                )
+
     for n in entity.nodes:
         if isinstance(n.flyte_entity, WorkflowBase):
             # We are currently not supporting reference workflows since these will
@@ -244,13 +262,13 @@ def get_serializable_workflow(
                 raise TypeError(
                     f"Unexpected type for serialized form of workflow. Expected {admin_workflow_models.WorkflowSpec}, but got {type(sub_wf_spec)}"
                 )
-            sub_wfs.append(sub_wf_spec.template)
-            sub_wfs.extend(sub_wf_spec.sub_workflows)
+            add_sub_wfs([sub_wf_spec.template])
+            add_sub_wfs(sub_wf_spec.sub_workflows)
 
         if isinstance(n.flyte_entity, FlyteWorkflow):
             get_serializable(entity_mapping, settings, n.flyte_entity, options)
-            sub_wfs.append(n.flyte_entity)
-            sub_wfs.extend([s for s in n.flyte_entity.sub_workflows.values()])
+            add_sub_wfs([n.flyte_entity])
+            add_sub_wfs(n.flyte_entity.sub_workflows.values())
 
         if isinstance(n.flyte_entity, BranchNode):
             if_else: workflow_model.IfElseBlock = n.flyte_entity._ifelse_block
@@ -267,12 +285,12 @@ def get_serializable_workflow(
             for leaf_node in leaf_nodes:
                 if isinstance(leaf_node.flyte_entity, WorkflowBase):
                     sub_wf_spec = get_serializable(entity_mapping, settings, leaf_node.flyte_entity, options)
-                    sub_wfs.append(sub_wf_spec.template)
-                    sub_wfs.extend(sub_wf_spec.sub_workflows)
+                    add_sub_wfs([sub_wf_spec.template])
+                    add_sub_wfs(sub_wf_spec.sub_workflows)
                 elif isinstance(leaf_node.flyte_entity, FlyteWorkflow):
                     get_serializable(entity_mapping, settings, leaf_node.flyte_entity, options)
-                    sub_wfs.append(leaf_node.flyte_entity)
-                    sub_wfs.extend([s for s in leaf_node.flyte_entity.sub_workflows.values()])
+                    add_sub_wfs([leaf_node.flyte_entity])
+                    add_sub_wfs(leaf_node.flyte_entity.sub_workflows.values())
 
     wf_id = _identifier_model.Identifier(
         resource_type=_identifier_model.ResourceType.WORKFLOW,
@@ -289,8 +307,14 @@ def get_serializable_workflow(
         nodes=upstream_node_models,
         outputs=entity.output_bindings,
     )
+    # Sort by identifier: short_string() renders the whole template as text, which costs as much as serializing it.
+    # Settings used by pyflyte package leave project, domain and version unset, so normalize those before comparing.
     return admin_workflow_models.WorkflowSpec(
-        template=wf_t, sub_workflows=sorted(set(sub_wfs), key=lambda x: x.short_string())
+        template=wf_t,
+        sub_workflows=sorted(
+            sub_wfs.values(),
+            key=lambda x: (x.id.project or "", x.id.domain or "", x.id.name or "", x.id.version or ""),
+        ),
     )
 
 
@@ -9,6 +9,7 @@ import flytekit.configuration
 from flytekit import StructuredDataset, kwtypes
 from flytekit.configuration import Image, ImageConfig
 from flytekit.core.condition import conditional
+from flytekit.core.node_creation import create_node
 from flytekit.core.task import task
 from flytekit.core.workflow import WorkflowFailurePolicy, WorkflowMetadata, WorkflowMetadataDefaults, workflow
 from flytekit.exceptions.user import FlyteValidationException, FlyteValueException
@@ -78,6 +79,51 @@ def test_default_values():
 
     assert wf() is True
     assert wf(a=False) is False
+    # Overriding a default must not leak into subsequent calls
+    assert wf() is True
+    assert wf.python_interface.default_inputs_as_kwargs == {"a": True}
+    # Modifying the returned defaults must not change the interface
+    wf.python_interface.default_inputs_as_kwargs.update(a=False)
+    assert wf() is True
+
+
+def test_wf_cycle():
+    @task
+    def t1():
+        ...
+
+    @task
+    def t2():
+        ...
+
+    @task
+    def t3():
+        ...
+
+    # Only the nodes in the cycle are reported, not n0 upstream of it or n3 downstream of it
+    with pytest.raises(FlyteValidationException, match=r"cycle between nodes \['n1', 'n2'\]"):
+
+        @workflow
+        def my_wf():
+            n0 = create_node(t1)
+            n1 = create_node(t2)
+            n2 = create_node(t3)
+            n3 = create_node(t1)
+            n0 >> n1
+            n1 >> n2
+            n2 >> n1
+            n2 >> n3
+
+    @workflow
+    def my_wf2():
+        n1 = create_node(t1)
+        n2 = create_node(t2)
+        n3 = create_node(t3)
+        n1 >> n2
+        n1 >> n3
+        n2 >> n3
+
+    assert len(my_wf2.nodes) == 3
 
 
 def test_list_output_wf():
@@ -18,6 +18,14 @@ def test_identifier():
     assert obj2.version == "version"
     assert obj2.resource_type == identifier.ResourceType.TASK
     assert obj2.resource_type_name() == "TASK"
+    assert hash(obj2) == hash(obj)
+    assert {obj: 1}[obj2] == 1
+
+    # Unset fields compare equal to their protobuf defaults, so they have to hash the same too.
+    obj3 = identifier.Identifier(identifier.ResourceType.TASK, "project", "domain", "name", None)
+    obj4 = identifier.Identifier(identifier.ResourceType.TASK, "project", "domain", "name", "")
+    assert obj3 == obj4
+    assert hash(obj3) == hash(obj4)
 
 
 def test_node_execution_identifier():
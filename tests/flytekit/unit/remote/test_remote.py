@@ -6,6 +6,7 @@ import pytest
 from mock import MagicMock, patch
 
 import flytekit.configuration
+from flytekit import task, workflow
 from flytekit.configuration import Config, DefaultImages, ImageConfig
 from flytekit.exceptions import user as user_exceptions
 from flytekit.models import common as common_models
@@ -211,3 +212,98 @@ def test_generate_http_domain_sandbox_rewrite(mock_client):
         config=Config.auto(config_file=temp_filename), default_project="project", default_domain="domain"
     )
     assert remote.generate_http_domain() == "http://localhost:30080"
+
+
+@patch("flytekit.remote.remote.FlyteRemote.fetch_workflow")
+def test_register_workflow_default_launch_plan_created_once(mock_fetch_workflow):
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    @workflow
+    def wf(a: int) -> int:
+        return t1(a=a)
+
+    serialization_settings = flytekit.configuration.SerializationSettings(
+        project="p1",
+        domain="d1",
+        version="v1",
+        image_config=ImageConfig.auto(img_name=DefaultImages.default_image()),
+    )
+
+    mock_client = MagicMock()
+    mock_client.get_workflow.side_effect = user_exceptions.FlyteEntityNotExistException("not found")
+    remote = FlyteRemote(config=Config.auto(), default_project="p1", default_domain="d1")
+    remote._client = mock_client
+
+    remote.register_workflow(wf, serialization_settings, version="v1")
+    assert mock_client.create_workflow.call_count == 1
+    assert mock_client.create_launch_plan.call_count == 1
+
+    mock_client.reset_mock()
+    remote.register_workflow(wf, serialization_settings, version="v1", default_launch_plan=False)
+    assert mock_client.create_workflow.call_count == 1
+    assert mock_client.create_launch_plan.call_count == 0
+
+
+@patch("flytekit.remote.remote.FlyteRemote.fetch_workflow")
+def test_register_workflow_already_exists(mock_fetch_workflow):
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    @workflow
+    def wf(a: int) -> int:
+        return t1(a=a)
+
+    serialization_settings = flytekit.configuration.SerializationSettings(
+        project="p1",
+        domain="d1",
+        version="v1",
+        image_config=ImageConfig.auto(img_name=DefaultImages.default_image()),
+    )
+
+    mock_client = MagicMock()
+    remote = FlyteRemote(config=Config.auto(), default_project="p1", default_domain="d1")
+    remote._client = mock_client
+
+    remote.register_workflow(wf, serialization_settings, version="v1")
+    mock_client.get_workflow.assert_called_once()
+    assert mock_client.create_workflow.call_count == 0
+    # The default launch plan is still created for workflows that already exist
+    assert mock_client.create_launch_plan.call_count == 1
+
+
+@patch("flytekit.remote.remote.FlyteRemote.fetch_workflow")
+def test_register_workflow_sub_workflow_default_launch_plans(mock_fetch_workflow):
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    @workflow
+    def sub_wf(a: int) -> int:
+        return t1(a=a)
+
+    @workflow
+    def wf(a: int) -> int:
+        return sub_wf(a=a)
+
+    serialization_settings = flytekit.configuration.SerializationSettings(
+        project="p1",
+        domain="d1",
+        version="v1",
+        image_config=ImageConfig.auto(img_name=DefaultImages.default_image()),
+    )
+
+    mock_client = MagicMock()
+    mock_client.get_workflow.side_effect = user_exceptions.FlyteEntityNotExistException("not found")
+    remote = FlyteRemote(config=Config.auto(), default_project="p1", default_domain="d1")
+    remote._client = mock_client
+
+    remote.register_workflow(wf, serialization_settings, version="v1")
+    assert [c.args[0].name for c in mock_client.create_launch_plan.call_args_list] == [sub_wf.name, wf.name]
+
+    # Turning off the default launch plan only applies to the workflow being registered
+    mock_client.reset_mock()
+    remote.register_workflow(wf, serialization_settings, version="v1", default_launch_plan=False)
+    assert [c.args[0].name for c in mock_client.create_launch_plan.call_args_list] == [sub_wf.name]
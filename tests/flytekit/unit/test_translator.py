@@ -1,6 +1,8 @@
 import typing
 from collections import OrderedDict
 
+import pytest
+
 import flytekit.configuration
 from flytekit import ContainerTask, Resources
 from flytekit.configuration import FastSerializationSettings, Image, ImageConfig
@@ -9,8 +11,10 @@ from flytekit.core.launch_plan import LaunchPlan, ReferenceLaunchPlan
 from flytekit.core.reference_entity import ReferenceSpec, ReferenceTemplate
 from flytekit.core.task import ReferenceTask, task
 from flytekit.core.workflow import ReferenceWorkflow, workflow
+from flytekit.exceptions.user import FlyteValidationException
 from flytekit.models.core import identifier as identifier_models
-from flytekit.tools.translator import get_serializable
+from flytekit.remote import FlyteWorkflow
+from flytekit.tools.translator import gather_dependent_entities, get_serializable
 
 default_img = Image(name="default", fqn="test", tag="tag")
 serialization_settings = flytekit.configuration.SerializationSettings(
@@ -159,3 +163,88 @@ def test_launch_plan_with_fixed_input():
     assert len(task_spec.template.interface.outputs) == 1
     assert len(task_spec.template.nodes) == 1
     assert len(task_spec.template.nodes[0].inputs) == 2
+
+
+def test_shared_sub_workflows():
+    @task
+    def t1(a: int) -> int:
+        return a + 2
+
+    @workflow
+    def leaf_wf(a: int) -> int:
+        return t1(a=a)
+
+    @workflow
+    def mid_wf(a: int) -> int:
+        x = leaf_wf(a=a)
+        return leaf_wf(a=x)
+
+    @workflow
+    def my_wf(a: int) -> int:
+        x = mid_wf(a=a)
+        y = leaf_wf(a=x)
+        return mid_wf(a=y)
+
+    wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
+    sub_wf_names = [s.id.name for s in wf_spec.sub_workflows]
+    assert sub_wf_names == sorted([leaf_wf.name, mid_wf.name])
+
+
+def test_sub_workflows_with_unset_ids():
+    @task
+    def t1(a: int) -> int:
+        return a + 2
+
+    @workflow
+    def local_sub(a: int) -> int:
+        return t1(a=a)
+
+    @workflow
+    def remote_wf(a: int) -> int:
+        return t1(a=a)
+
+    serialized = OrderedDict()
+    remote_spec = get_serializable(serialized, serialization_settings, remote_wf)
+    task_templates, _, _ = gather_dependent_entities(serialized)
+    fwf = FlyteWorkflow.promote_from_model(remote_spec.template, tasks=task_templates)
+    fwf._python_interface = remote_wf.python_interface
+
+    @workflow
+    def parent(a: int) -> int:
+        x = local_sub(a=a)
+        return fwf(a=x)
+
+    # Like pyflyte package, leave the project, domain and version unset.
+    settings = flytekit.configuration.SerializationSettings(
+        image_config=ImageConfig(default_image=default_img, images=[default_img])
+    )
+    wf_spec = get_serializable(OrderedDict(), settings, parent)
+    assert [s.id.name for s in wf_spec.sub_workflows] == [local_sub.name, remote_wf.name]
+
+
+def test_sub_workflows_with_clashing_ids():
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    @task
+    def t2(a: int) -> int:
+        return a + 2
+
+    def make(t):
+        @workflow
+        def sub(a: int) -> int:
+            return t(a=a)
+
+        return sub
+
+    sub1 = make(t1)
+    sub2 = make(t2)
+
+    @workflow
+    def my_wf(a: int) -> int:
+        x = sub1(a=a)
+        return sub2(a=x)
+
+    with pytest.raises(FlyteValidationException, match="same id"):
+        get_serializable(OrderedDict(), serialization_settings, my_wf)